@@ -8,7 +8,6 @@ from loguru import logger as log
 
 from openweb_proxy import config
 from .cli import parse_arguments
-from .proxy_miner import ProxyMiner
 
 
 def main() -> None:
@@ -23,6 +22,9 @@ def main() -> None:
     :return: None
     """
     args = parse_arguments()
+    # Deferred so that `--help` or bad arguments exit before importing requests
+    # pylint: disable=import-outside-toplevel
+    from .proxy_miner import ProxyMiner
 
     log.remove(0)
     log.add(sys.stderr, level=args.verbose)
@@ -4,6 +4,7 @@
 import os
 import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from time import sleep
 import socket
 
@@ -14,8 +15,6 @@ from loguru import logger as log
 
 from openweb_proxy import config
 
-from .random_ua_headers import random_ua_headers
-
 
 class ProxyMiner:
     """
@@ -32,34 +31,46 @@ class ProxyMiner:
         self,
         protocol: str = config.PROXY_PROTOCOL,
         timeout: int = config.TIMEOUT,
-        sources: dict[str, list] = config.PROXY_SOURCES,
+        sources: dict[str, list] | None = None,
         checker: dict[str, str] = config.CHECK_URLS,
     ):
         self.protocol = protocol
         self.timeout = timeout
-        self.sources = sources
+        if sources is not None:
+            self.sources = sources
         self.checker = checker
 
+        self.proxies: set[str] = set()
+
+    @cached_property
+    def sources(self) -> dict[str, list]:
+        """Public sources of proxies, defaults to PROXY_SOURCES.
+        Loaded on first use as only web runs need them."""
+        # pylint: disable=import-outside-toplevel
+        from .sources import PROXY_SOURCES
+
+        return PROXY_SOURCES
+
+    @cached_property
+    def banned_list(self) -> list[str]:
+        """Excluded addresses from the checker's banned file or URL.
+        Loaded on first use to avoid a download when nothing is cleaned."""
         if os.path.exists(self.checker["banned"]):
             with open(self.checker["banned"], "r", encoding="utf-8") as file:
-                self.banned_list = file.read().split("\n")
-        elif config.RE_URL.match(self.checker["banned"]):
+                return file.read().split("\n")
+        if config.RE_URL.match(self.checker["banned"]):
             try:
-                self.banned_list = requests.get(
+                return requests.get(
                     self.checker["banned"], timeout=self.timeout
                 ).text.split("\n")
             except requests.exceptions.RequestException as e:
                 log.warning(f"Unable to get banned list: {e}")
-                self.banned_list = []
-        elif self.checker["banned"]:
+                return []
+        if self.checker["banned"]:
             log.warning(
                 f"{self.checker['banned']}: Not a URL or file does not exist"
             )
-            self.banned_list = []
-        else:
-            self.banned_list = []
-
-        self.proxies: set[str] = set()
+        return []
 
     def _get_proxies(self, url: str) -> None:
         """Get proxies list from github and al"""
@@ -127,6 +138,10 @@ class ProxyMiner:
         return proxy
 
     def _check_http(self, proxy) -> str | bool:
+        # fake_useragent is slow to import, only pay for it when checking
+        # pylint: disable=import-outside-toplevel
+        from .random_ua_headers import random_ua_headers
+
         try:
             r = requests.get(
                 self.checker["url"],
@@ -188,6 +203,9 @@ class ProxyMiner:
 
         :return: None
         """
+        # Fetch the banned list over the real network, before _check_generic
+        # redirects the process's sockets through the proxies under test
+        banned_list = self.banned_list if self.proxies else []
         # We can use a with statement to ensure threads are cleaned up promptly
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             proxies_clean = set()
@@ -200,10 +218,7 @@ class ProxyMiner:
                 for proxy in self.proxies
             }
             for proxy in as_completed(future_proxies):
-                if (
-                    proxy.result()
-                    and future_proxies[proxy] not in self.banned_list
-                ):
+                if proxy.result() and future_proxies[proxy] not in banned_list:
                     proxies_clean.add(future_proxies[proxy])
                 continue
         self.proxies = proxies_clean
@@ -1,10 +1,17 @@
+from functools import cache
+
 from fake_useragent import UserAgent
 
 
+@cache
+def _user_agent() -> UserAgent:
+    """Build the UserAgent once, loading its browsers data is costly"""
+    return UserAgent()
+
+
 def random_ua_headers() -> dict[str, str]:
     """
     generate a random user-agent
     most basic technique against bot blockers
     """
-    ua = UserAgent()
-    return {"user-agent": ua.random}
+    return {"user-agent": _user_agent().random}